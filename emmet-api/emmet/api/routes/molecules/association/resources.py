@@ -30,6 +30,29 @@ from emmet.api.core.settings import MAPISettings
 
 timeout = MAPISettings().TIMEOUT
 
+# Query operators, hint scheme and header processor hold no per-request state,
+# so they are built once at import rather than on every resource registration
+_MOL_ASSOC_QUERY_OPS = [
+    MultiMPculeIDQuery(),
+    FormulaQuery(),
+    ChemsysQuery(),
+    CompositionElementsQuery(),
+    ChargeSpinQuery(),
+    MultiTaskIDQuery(),
+    CalcMethodQuery(),
+    HashQuery(),
+    StringRepQuery(),
+    DeprecationQuery(),
+    NumericQuery(model=MoleculeDoc),
+    PaginationQuery(),
+    SparseFieldsQuery(
+        MoleculeDoc,
+        default_fields=["molecule_id", "formula_alphabetical", "last_updated"],
+    ),
+]
+_MOL_ASSOC_HINT = MoleculesHintScheme()
+_MOL_ASSOC_HEADER = GlobalHeaderProcessor()
+
 
 def find_molecule_assoc_resource(assoc_store):
     resource = PostOnlyResource(
@@ -49,30 +72,13 @@ def mol_assoc_resource(assoc_store):
     resource = ReadOnlyResource(
         assoc_store,
         MoleculeDoc,
-        query_operators=[
-            MultiMPculeIDQuery(),
-            FormulaQuery(),
-            ChemsysQuery(),
-            CompositionElementsQuery(),
-            ChargeSpinQuery(),
-            MultiTaskIDQuery(),
-            CalcMethodQuery(),
-            HashQuery(),
-            StringRepQuery(),
-            DeprecationQuery(),
-            NumericQuery(model=MoleculeDoc),
-            PaginationQuery(),
-            SparseFieldsQuery(
-                MoleculeDoc,
-                default_fields=["molecule_id", "formula_alphabetical", "last_updated"],
-            ),
-        ],
-        header_processor=GlobalHeaderProcessor(),
+        query_operators=_MOL_ASSOC_QUERY_OPS,
+        header_processor=_MOL_ASSOC_HEADER,
         tags=["Associated Molecules"],
         sub_path="/assoc/",
         disable_validation=True,
-        hint_scheme=MoleculesHintScheme(),
-        timeout=MAPISettings().TIMEOUT,
+        hint_scheme=_MOL_ASSOC_HINT,
+        timeout=timeout,
     )
 
     return resource
@@ -18,6 +18,8 @@ from emmet.api.routes.molecules.utils import MethodQuery, MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def bonding_resource(bonds_store):
     resource = ReadOnlyResource(
@@ -49,7 +51,7 @@ def bonding_resource(bonds_store):
         tags=["Molecules Bonds"],
         sub_path="/bonding/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
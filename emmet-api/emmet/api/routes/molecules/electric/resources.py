@@ -22,6 +22,8 @@ from emmet.api.routes.molecules.utils import MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def electric_multipole_resource(multipole_store):
     resource = ReadOnlyResource(
@@ -58,7 +60,7 @@ def electric_multipole_resource(multipole_store):
         tags=["Molecules Electric Dipoles and Multipoles"],
         sub_path="/multipoles/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
@@ -16,6 +16,8 @@ from emmet.api.routes.molecules.utils import MethodQuery, MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def metal_binding_resource(metal_binding_store):
     resource = ReadOnlyResource(
@@ -47,7 +49,7 @@ def metal_binding_resource(metal_binding_store):
         tags=["Molecules Metal Binding"],
         sub_path="/metal_binding/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
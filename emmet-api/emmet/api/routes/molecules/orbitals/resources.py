@@ -15,6 +15,8 @@ from emmet.api.routes.molecules.utils import MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def orbitals_resource(orbital_store):
     resource = ReadOnlyResource(
@@ -43,7 +45,7 @@ def orbitals_resource(orbital_store):
         tags=["Molecules Orbitals"],
         sub_path="/orbitals/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
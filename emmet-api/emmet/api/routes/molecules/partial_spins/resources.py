@@ -15,6 +15,8 @@ from emmet.api.routes.molecules.utils import MethodQuery, MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def spins_resource(spins_store):
     resource = ReadOnlyResource(
@@ -45,7 +47,7 @@ def spins_resource(spins_store):
         tags=["Molecules Partial Spins"],
         sub_path="/partial_spins/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
@@ -20,6 +20,8 @@ from emmet.api.routes.molecules.utils import MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def redox_resource(redox_store):
     resource = ReadOnlyResource(
@@ -61,7 +63,7 @@ def redox_resource(redox_store):
         tags=["Molecules Redox"],
         sub_path="/redox/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
@@ -22,6 +22,8 @@ from emmet.api.routes.molecules.utils import MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def thermo_resource(thermo_store):
     resource = ReadOnlyResource(
@@ -63,7 +65,7 @@ def thermo_resource(thermo_store):
         tags=["Molecules Thermo"],
         sub_path="/thermo/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
@@ -15,6 +15,8 @@ from emmet.api.routes.molecules.utils import MultiPropertyIDQuery
 from emmet.api.core.settings import MAPISettings
 from emmet.api.core.global_header import GlobalHeaderProcessor
 
+timeout = MAPISettings().TIMEOUT
+
 
 def vibration_resource(vibes_store):
     resource = ReadOnlyResource(
@@ -43,7 +45,7 @@ def vibration_resource(vibes_store):
         tags=["Molecules Vibrations"],
         sub_path="/vibrations/",
         disable_validation=True,
-        timeout=MAPISettings().TIMEOUT,
+        timeout=timeout,
     )
 
     return resource
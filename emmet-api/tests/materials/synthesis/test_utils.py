@@ -1,5 +1,7 @@
-import os
-from json import load
+from pathlib import Path
+
+import orjson
+import pytest
 from emmet.api.routes.materials.synthesis.utils import (
     make_ellipsis,
     mask_paragraphs,
@@ -9,6 +11,13 @@ from emmet.api.core.settings import MAPISettings
 from emmet.core.synthesis import SynthesisSearchResultModel
 
 
+@pytest.fixture(scope="module")
+def synth_doc():
+    return SynthesisSearchResultModel(
+        **orjson.loads(Path(MAPISettings().TEST_FILES, "synth_doc.json").read_bytes())
+    )
+
+
 def test_make_ellipsis():
     text = "Lorem ipsum dolor sit amet"
     altered_text = make_ellipsis(text, limit=10)
@@ -18,20 +27,12 @@ def test_make_ellipsis():
     assert altered_text == "... sit amet"
 
 
-def test_mask_paragraphs():
-    with open(os.path.join(MAPISettings().TEST_FILES, "synth_doc.json")) as file:
-        synth_doc = load(file)
-
-    doc = SynthesisSearchResultModel(**synth_doc)
-    new_doc = mask_paragraphs(doc.model_dump(), limit=10)
+def test_mask_paragraphs(synth_doc):
+    new_doc = mask_paragraphs(synth_doc.model_dump(), limit=10)
 
     assert new_doc["paragraph_string"] == "Lorem ..."
 
 
-def test_mask_highlights():
-    with open(os.path.join(MAPISettings().TEST_FILES, "synth_doc.json")) as file:
-        synth_doc = load(file)
-
-    doc = SynthesisSearchResultModel(**synth_doc)
-    new_doc = mask_highlights(doc.model_dump(), limit=10)
+def test_mask_highlights(synth_doc):
+    new_doc = mask_highlights(synth_doc.model_dump(), limit=10)
     assert new_doc["highlights"][0]["texts"][0]["value"] == "... anim ..."
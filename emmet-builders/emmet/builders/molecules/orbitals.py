@@ -2,7 +2,7 @@ from collections import defaultdict
 from datetime import datetime
 from itertools import chain
 from math import ceil
-from typing import Optional, Iterable, Iterator, List, Dict
+from typing import Container, Optional, Iterable, Iterator, List, Dict, Set, Tuple
 
 from maggma.builders import Builder
 from maggma.core import Store
@@ -19,6 +19,20 @@ __author__ = "Evan Spotte-Smith"
 
 SETTINGS = EmmetBuildSettings()
 
+# Cursor batch size for scans that only return small ID/hash documents
+ID_BATCH_SIZE = 5000
+
+# Server-side equivalent of the NBO7 filter in process_item: rem flags are
+# often stored as strings (e.g. "true"), so match on truthiness, not True
+_FALSY = [None, False, 0, ""]
+NBO_ENTRY_CRITERIA = {
+    "output.nbo": {"$ne": None},
+    "$or": [
+        {"orig.rem.run_nbo6": {"$nin": _FALSY}},
+        {"orig.rem.nbo_external": {"$nin": _FALSY}},
+    ],
+}
+
 
 class OrbitalBuilder(Builder):
     """
@@ -70,6 +84,7 @@ class OrbitalBuilder(Builder):
         self.tasks.ensure_index("state")
         self.tasks.ensure_index("formula_alphabetical")
         self.tasks.ensure_index("species_hash")
+        self._ensure_compound_index(self.tasks, [("species_hash", 1), ("task_id", 1)])
 
         # Search index for molecules
         self.molecules.ensure_index("molecule_id")
@@ -86,25 +101,83 @@ class OrbitalBuilder(Builder):
         self.orbitals.ensure_index("property_id")
         self.orbitals.ensure_index("last_updated")
         self.orbitals.ensure_index("formula_alphabetical")
+        self._ensure_compound_index(self.orbitals, [("molecule_id", 1), ("solvent", 1)])
+
+    @staticmethod
+    def _ensure_compound_index(store: Store, keys: List[Tuple[str, int]]) -> bool:
+        """
+        Tries to create a compound index, as Store.ensure_index only
+        supports single keys
+
+        Args:
+            store: Store to index
+            keys: list of (field, direction) pairs making up the index
+
+        Returns:
+            bool indicating if the index exists/was created
+        """
+
+        try:
+            store._collection.create_index(keys, background=True)
+            return True
+        except Exception:
+            return False
+
+    def _processed_molecule_ids(self) -> set:
+        """
+        Collect the molecule_ids already present in the orbitals Store.
+
+        Sorting on molecule_id before the $group lets the planner serve the
+        aggregation from the molecule_id index, so index keys are read rather
+        than each orbital document being unpacked as distinct() does.
+        """
+
+        return {
+            d["_id"]
+            for d in self.orbitals._collection.aggregate(
+                [{"$sort": {"molecule_id": 1}}, {"$group": {"_id": "$molecule_id"}}],
+                allowDiskUse=True,
+                batchSize=ID_BATCH_SIZE,
+            )
+        }
+
+    def _find_unprocessed(self, query: Dict) -> Tuple[int, Set[str]]:
+        """
+        Find the species hashes of molecules without orbital documents
+
+        Args:
+            query: query for the molecules to consider
+
+        Returns:
+            number of unprocessed molecules, set of their species hashes
+        """
+
+        processed_docs = self._processed_molecule_ids()
+
+        # Stream the molecules once, keeping only the unprocessed hashes; no
+        # set of all molecule IDs is ever built
+        key = self.molecules.key
+        num_to_process = 0
+        to_process_hashes: Set[str] = set()
+        add_hash = to_process_hashes.add
+        for d in self.molecules.query(
+            query, [key, "species_hash"], batch_size=ID_BATCH_SIZE
+        ):
+            if d[key] not in processed_docs:
+                num_to_process += 1
+                add_hash(d["species_hash"])
+
+        return num_to_process, to_process_hashes
 
     def prechunk(self, number_splits: int) -> Iterable[Dict]:  # pragma: no cover
         """Prechunk the builder for distributed computation"""
 
         temp_query = dict(self.query)
         temp_query["deprecated"] = False
+        temp_query["entries"] = {"$elemMatch": NBO_ENTRY_CRITERIA}
 
         self.logger.info("Finding documents to process")
-        all_mols = list(
-            self.molecules.query(temp_query, [self.molecules.key, "species_hash"])
-        )
-
-        processed_docs = set([e for e in self.orbitals.distinct("molecule_id")])
-        to_process_docs = {d[self.molecules.key] for d in all_mols} - processed_docs
-        to_process_hashes = {
-            d["species_hash"]
-            for d in all_mols
-            if d[self.molecules.key] in to_process_docs
-        }
+        _, to_process_hashes = self._find_unprocessed(temp_query)
 
         N = ceil(len(to_process_hashes) / number_splits)
 
@@ -113,7 +186,7 @@ class OrbitalBuilder(Builder):
             query["species_hash"] = {"$in": list(hash_chunk)}
             yield {"query": query}
 
-    def get_items(self) -> Iterator[List[Dict]]:
+    def get_items(self) -> Iterator[Dict]:
         """
         Gets all items to process into orbital documents.
         This does no datetime checking; relying on on whether
@@ -133,125 +206,254 @@ class OrbitalBuilder(Builder):
         # Get all processed molecules
         temp_query = dict(self.query)
         temp_query["deprecated"] = False
+        temp_query["entries"] = {"$elemMatch": NBO_ENTRY_CRITERIA}
 
         self.logger.info("Finding documents to process")
-        all_mols = list(
-            self.molecules.query(temp_query, [self.molecules.key, "species_hash"])
-        )
+        num_to_process, to_process_hashes = self._find_unprocessed(temp_query)
 
-        processed_docs = set([e for e in self.orbitals.distinct("molecule_id")])
-        to_process_docs = {d[self.molecules.key] for d in all_mols} - processed_docs
-        to_process_hashes = {
-            d["species_hash"]
-            for d in all_mols
-            if d[self.molecules.key] in to_process_docs
-        }
-
-        self.logger.info(f"Found {len(to_process_docs)} unprocessed documents")
+        self.logger.info(f"Found {num_to_process} unprocessed documents")
         self.logger.info(f"Found {len(to_process_hashes)} unprocessed hashes")
 
         # Set total for builder bars to have a total
         self.total = len(to_process_hashes)
 
-        for shash in to_process_hashes:
-            mol_query = dict(temp_query)
-            mol_query["species_hash"] = shash
-            molecules = list(self.molecules.query(criteria=mol_query))
+        # Query molecules for many hashes at once and group them locally
+        for hash_chunk in grouper(to_process_hashes, 1000):
+            mol_query = {**temp_query, "species_hash": {"$in": list(hash_chunk)}}
+            by_hash = defaultdict(list)
+            for mol in self.molecules.query(criteria=mol_query):
+                by_hash[mol["species_hash"]].append(mol)
+
+            # Tasks are fetched here rather than in process_item so that
+            # process_item does no I/O and can run in worker processes
+            tasks_by_hash = self._get_candidate_tasks(by_hash)
+            for shash, molecules in by_hash.items():
+                yield {"molecules": molecules, "tasks": tasks_by_hash[shash]}
+
+    @staticmethod
+    def _orbital_entries_by_solvent(
+        entries: List[Dict], charge: int, spin_multiplicity: int
+    ) -> Dict[str, List[Dict]]:
+        """
+        Organize the entries of a molecule that can be used to make an
+        orbital document by solvent environment
+
+        Args:
+            entries: entries of a MoleculeDoc
+            charge: charge of the MoleculeDoc
+            spin_multiplicity: spin multiplicity of the MoleculeDoc
+
+        Returns:
+            dict mapping solvent to the relevant entries
+        """
+
+        if len(entries) == 0:
+            return dict()
+
+        by_solvent = defaultdict(list)
+        for e in entries:
+            if e["charge"] != charge or e["spin_multiplicity"] != spin_multiplicity:
+                continue
+
+            # Must have NBO, and must specifically use NBO7
+            if e["output"]["nbo"] is None:
+                continue
+            rem = e["orig"]["rem"]
+            if not (rem.get("run_nbo6", False) or rem.get("nbo_external", False)):
+                continue
+
+            # Organize by solvent environment
+            by_solvent[e["solvent"]].append(e)
+
+        return by_solvent
+
+    @staticmethod
+    def _rank_entries(entries: List[Dict], lot_scores: Dict) -> List[Dict]:
+        """
+        Sort entries from best to worst: highest level of theory first, then
+        lowest electronic energy
+
+        Args:
+            entries: entries of a MoleculeDoc for a single solvent
+            lot_scores: cache of level of theory scores, updated in place
+
+        Returns:
+            sorted entries
+        """
+
+        def lot_score(lot) -> int:
+            if lot not in lot_scores:
+                lot_scores[lot] = sum(evaluate_lot(lot))
+            return lot_scores[lot]
+
+        return sorted(
+            entries,
+            key=lambda x: (
+                lot_score(x["level_of_theory"]),
+                x["energy"],
+            ),
+        )
+
+    @staticmethod
+    def _stored_task_id(task_id, stored_ids: Container):
+        """
+        Find how a task ID is stored, as task IDs may be stored either as
+        given or as integers
+
+        Args:
+            task_id: task ID from a MoleculeDoc entry
+            stored_ids: task IDs present in the tasks Store
+
+        Returns:
+            the stored task ID, or None if the task is not stored
+        """
+
+        if task_id in stored_ids:
+            return task_id
+        try:
+            task_id = int(task_id)
+        except ValueError:
+            return None
+        return task_id if task_id in stored_ids else None
+
+    def _get_candidate_tasks(
+        self, molecules_by_hash: Dict[str, List[Dict]]
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch the task used to make each orbital document for batches of
+        molecules, grouped by species hash
+
+        Which candidate tasks exist is checked with a single query that only
+        returns task IDs; full task documents are then fetched, again in a
+        single query, only for the best available task of each molecule and
+        solvent
 
-            yield molecules
+        Args:
+            molecules_by_hash: MoleculeDocs in dict form, by species hash
 
-    def process_item(self, items: List[Dict]) -> List[Dict]:
+        Returns:
+            dict mapping species hash to a list of task documents
+        """
+
+        lot_scores: Dict = dict()
+        ranked_ids: Dict[str, List[List]] = defaultdict(list)
+        candidate_ids = set()
+        for shash, molecules in molecules_by_hash.items():
+            for mol in molecules:
+                by_solvent = self._orbital_entries_by_solvent(
+                    mol["entries"], mol["charge"], mol["spin_multiplicity"]
+                )
+                for entries in by_solvent.values():
+                    task_ids = [
+                        e["task_id"] for e in self._rank_entries(entries, lot_scores)
+                    ]
+                    ranked_ids[shash].append(task_ids)
+                    for task_id in task_ids:
+                        candidate_ids.add(task_id)
+                        try:
+                            candidate_ids.add(int(task_id))
+                        except ValueError:
+                            pass
+
+        tasks_by_hash: Dict[str, List[Dict]] = defaultdict(list)
+        if len(candidate_ids) == 0:
+            return tasks_by_hash
+
+        criteria = {
+            "species_hash": {"$in": list(ranked_ids)},
+            "orig": {"$exists": True},
+        }
+        stored_ids = defaultdict(set)
+        for t in self.tasks.query(
+            {**criteria, "task_id": {"$in": list(candidate_ids)}},
+            properties=["task_id", "species_hash"],
+            batch_size=ID_BATCH_SIZE,
+        ):
+            stored_ids[t["species_hash"]].add(t["task_id"])
+
+        best_ids = set()
+        for shash, hash_ranked_ids in ranked_ids.items():
+            for task_ids in hash_ranked_ids:
+                for task_id in task_ids:
+                    stored_id = self._stored_task_id(task_id, stored_ids[shash])
+                    if stored_id is not None:
+                        best_ids.add(stored_id)
+                        break
+
+        if len(best_ids) == 0:
+            return tasks_by_hash
+
+        for t in self.tasks.query({**criteria, "task_id": {"$in": list(best_ids)}}):
+            tasks_by_hash[t["species_hash"]].append(t)
+
+        return tasks_by_hash
+
+    def process_item(self, item: Dict) -> List[Dict]:
         """
         Process the tasks into a OrbitalDocs
 
         Args:
-            tasks List[Dict] : a list of MoleculeDocs in dict form
+            item Dict : MoleculeDocs ("molecules") and their candidate
+                TaskDocuments ("tasks"), in dict form
 
         Returns:
             [dict] : a list of new orbital docs
         """
 
-        mols = [MoleculeDoc(**item) for item in items]
+        # Only top-level fields of the MoleculeDocs are used, so full validation
+        # of these trusted database documents can be skipped
+        mols = [MoleculeDoc.model_construct(**mol) for mol in item["molecules"]]
         shash = mols[0].species_hash
         mol_ids = [m.molecule_id for m in mols]
         self.logger.info(f"Processing {shash} : {mol_ids}")
 
-        orbital_docs = list()
+        # No usable NBO tasks for any of these molecules; nothing to build
+        if len(item["tasks"]) == 0:
+            self.logger.debug(f"No orbital tasks for {shash}")
+            return list()
 
-        for mol in mols:
-            correct_charge_spin = [
-                e
-                for e in mol.entries
-                if e["charge"] == mol.charge
-                and e["spin_multiplicity"] == mol.spin_multiplicity
-            ]
+        tdocs: Dict = dict()
+        for tdoc in item["tasks"]:
+            tdocs.setdefault(tdoc["task_id"], tdoc)
 
-            # Must have NBO, and must specifically use NBO7
-            orbital_entries = [
-                e
-                for e in correct_charge_spin
-                if e["output"]["nbo"] is not None
-                and (
-                    e["orig"]["rem"].get("run_nbo6", False)
-                    or e["orig"]["rem"].get("nbo_external", False)
-                )
-            ]
+        orbital_docs = list()
 
-            # Organize by solvent environment
-            by_solvent = defaultdict(list)
-            for entry in orbital_entries:
-                by_solvent[entry["solvent"]].append(entry)
+        # Many entries share a level of theory; score each one only once
+        lot_scores: Dict = dict()
+
+        for mol in mols:
+            by_solvent = self._orbital_entries_by_solvent(
+                mol.entries, mol.charge, mol.spin_multiplicity
+            )
 
             for solvent, entries in by_solvent.items():
                 # No documents with NBO data; no documents to be made
                 if len(entries) == 0:
                     continue
-                else:
-                    sorted_entries = sorted(
-                        entries,
-                        key=lambda x: (
-                            sum(evaluate_lot(x["level_of_theory"])),
-                            x["energy"],
-                        ),
-                    )
 
-                    for best in sorted_entries:
-                        task = best["task_id"]
+                sorted_entries = self._rank_entries(entries, lot_scores)
 
-                        tdoc = self.tasks.query_one(
-                            {
-                                "task_id": task,
-                                "species_hash": shash,
-                                "orig": {"$exists": True},
-                            }
-                        )
+                for best in sorted_entries:
+                    task = self._stored_task_id(best["task_id"], tdocs)
 
-                        if tdoc is None:
-                            try:
-                                tdoc = self.tasks.query_one(
-                                    {
-                                        "task_id": int(task),
-                                        "species_hash": shash,
-                                        "orig": {"$exists": True},
-                                    }
-                                )
-                            except ValueError:
-                                tdoc = None
+                    if task is None:
+                        continue
 
-                        if tdoc is None:
-                            continue
+                    tdoc = tdocs[task]
 
-                        task_doc = TaskDocument(**tdoc)
+                    task_doc = TaskDocument(**tdoc)
 
-                        if task_doc is None:
-                            continue
+                    if task_doc is None:
+                        continue
 
-                        orbital_doc = OrbitalDoc.from_task(
-                            task_doc, molecule_id=mol.molecule_id, deprecated=False
-                        )
+                    orbital_doc = OrbitalDoc.from_task(
+                        task_doc, molecule_id=mol.molecule_id, deprecated=False
+                    )
 
-                        if orbital_doc is not None:
-                            orbital_docs.append(orbital_doc)
+                    # Only the best available entry is needed for each solvent
+                    if orbital_doc is not None:
+                        orbital_docs.append(orbital_doc)
+                        break
 
         self.logger.debug(f"Produced {len(orbital_docs)} orbital docs for {shash}")
 
@@ -275,11 +477,23 @@ class OrbitalBuilder(Builder):
                 }
             )
 
-        molecule_ids = list({item["molecule_id"] for item in docs})
+        solvents_by_molecule = defaultdict(set)
+        for item in docs:
+            solvents_by_molecule[item["molecule_id"]].add(item["solvent"])
 
         if len(items) > 0:
             self.logger.info(f"Updating {len(docs)} orbital documents")
-            self.orbitals.remove_docs({self.orbitals.key: {"$in": molecule_ids}})
+            # Existing (molecule_id, solvent) docs are replaced by the upsert
+            # below; only docs for solvents no longer produced need removing
+            if len(solvents_by_molecule) > 0:
+                self.orbitals.remove_docs(
+                    {
+                        "$or": [
+                            {"molecule_id": mol_id, "solvent": {"$nin": list(solvents)}}
+                            for mol_id, solvents in solvents_by_molecule.items()
+                        ]
+                    }
+                )
             self.orbitals.update(
                 docs=docs,
                 key=["molecule_id", "solvent"],
@@ -68,3 +68,75 @@ def test_new_orbitals(new_tasks_store, new_mol_store, new_orbital_store):
 
     assert new_orbital_store.count() == 19
     assert new_orbital_store.count({"open_shell": True}) == 11
+
+
+def test_update_targets_replaces_solvents(tasks_store, mol_store):
+    store = MemoryStore()
+    builder = OrbitalBuilder(tasks_store, mol_store, store)
+    builder.connect()
+
+    docs = next(docs for docs in map(builder.process_item, builder.get_items()) if docs)
+    builder.update_targets([docs])
+    mol_id, solvent = docs[0]["molecule_id"], docs[0]["solvent"]
+    original_id = store.query_one({"molecule_id": mol_id, "solvent": solvent})["_id"]
+
+    # a solvent that is no longer produced for this molecule, and an unrelated doc
+    stale = {k: v for k, v in docs[0].items() if k != "_id"}
+    store.update([dict(stale, solvent="STALE")], key=["molecule_id", "solvent"])
+    store.update(
+        [dict(stale, molecule_id="other-molecule", solvent="STALE")],
+        key=["molecule_id", "solvent"],
+    )
+    num_docs = store.count()
+
+    builder.update_targets([[{k: v for k, v in d.items() if k != "_id"} for d in docs]])
+
+    assert store.count({"molecule_id": mol_id, "solvent": "STALE"}) == 0
+    assert store.count({"molecule_id": "other-molecule", "solvent": "STALE"}) == 1
+    assert store.count({"molecule_id": mol_id, "solvent": solvent}) == 1
+    assert (
+        store.query_one({"molecule_id": mol_id, "solvent": solvent})["_id"]
+        == original_id
+    )
+    assert store.count() == num_docs - 1
+
+
+def test_get_candidate_tasks_only_best(mol_store):
+    tasks = MemoryStore()
+    tasks.connect()
+    tasks.update(
+        [
+            {"task_id": i, "species_hash": "abc", "orig": {}, "data": "x" * 10}
+            for i in (1, 3, 4)
+        ],
+        key="task_id",
+    )
+    builder = OrbitalBuilder(tasks, mol_store, MemoryStore())
+
+    def entry(task_id, solvent, energy):
+        return {
+            "task_id": task_id,
+            "solvent": solvent,
+            "energy": energy,
+            "level_of_theory": "wB97X-V/def2-TZVPPD/VACUUM",
+            "charge": 0,
+            "spin_multiplicity": 1,
+            "output": {"nbo": {}},
+            "orig": {"rem": {"run_nbo6": True}},
+        }
+
+    molecule = {
+        "charge": 0,
+        "spin_multiplicity": 1,
+        "entries": [
+            # task 2 ranks best but is not stored, so task 1 is used
+            entry("1", "NONE", -1.0),
+            entry("2", "NONE", -2.0),
+            entry("3", "NONE", 0.0),
+            entry("4", "SOLVENT=WATER", 0.0),
+        ],
+    }
+
+    candidates = builder._get_candidate_tasks({"abc": [molecule]})["abc"]
+    assert sorted(t["task_id"] for t in candidates) == [1, 4]
+    assert all(t["data"] == "x" * 10 for t in candidates)
@@ -326,6 +326,13 @@ def jsanitize(obj, strict=False, allow_bson=False):
     Returns:
         Sanitized dict that can be json serialized.
     """
+    # Fast path for the JSON-native scalars that make up most of a document
+    obj_type = type(obj)
+    if obj is None or obj_type is str or obj_type is int or obj_type is bool:
+        return obj
+    if obj_type is float:
+        return 0 if obj != obj else obj
+
     if allow_bson and (
         isinstance(obj, (datetime.datetime, bytes))
         or (bson is not None and isinstance(obj, bson.objectid.ObjectId))
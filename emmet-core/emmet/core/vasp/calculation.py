@@ -2,16 +2,21 @@
 
 # mypy: ignore-errors
 
+import hashlib
 import os
+import pickle
+import re
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
-from pymatgen.command_line.bader_caller import bader_analysis_from_path
-from pymatgen.command_line.chargemol_caller import ChargemolAnalysis
+from pymatgen.core import __version__ as pmg_version
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
 from pymatgen.core.trajectory import Trajectory
@@ -31,6 +36,7 @@ from pymatgen.io.vasp import (
     VolumetricData,
 )
 
+from emmet.core import __version__
 from emmet.core.math import ListMatrix3D, Matrix3D, Vector3D
 from emmet.core.utils import ValueEnum
 from emmet.core.vasp.calc_types import (
@@ -45,6 +51,8 @@ from emmet.core.vasp.task_valid import TaskState
 
 logger = logging.getLogger(__name__)
 
+_ELPH_POSCAR_RE = re.compile(r"POSCAR\.T=(.*?)(?:\.gz)?$")
+
 
 class VaspObject(ValueEnum):
     """Types of VASP data objects."""
@@ -63,6 +71,10 @@ class VaspObject(ValueEnum):
     PROCAR = "procar"
 
 
+_VASP_OBJECT_BY_NAME = {obj.name: obj for obj in VaspObject}  # type: ignore
+_VASP_OBJECT_NAME_RE = re.compile("|".join(map(re.escape, _VASP_OBJECT_BY_NAME)))
+
+
 class StoreTrajectoryOption(ValueEnum):
     FULL = "full"
     PARTIAL = "partial"
@@ -73,7 +85,8 @@ class CalculationBaseModel(BaseModel):
     """Wrapper around pydantic BaseModel with extra functionality."""
 
     def get(self, key: Any, default_value: Optional[Any] = None) -> Any:
-        return getattr(self, key, default_value)
+        # pydantic keeps field values in the instance __dict__
+        return self.__dict__.get(key, default_value)
 
 
 class PotcarSpec(BaseModel):
@@ -85,6 +98,8 @@ class PotcarSpec(BaseModel):
         None, description="summary statistics used to ID POTCARs without hashing"
     )
 
+    model_config = ConfigDict(frozen=True)
+
     @classmethod
     def from_potcar_single(cls, potcar_single: PotcarSingle) -> "PotcarSpec":
         """
@@ -100,7 +115,8 @@ class PotcarSpec(BaseModel):
         PotcarSpec
             A potcar spec.
         """
-        return cls(
+        # fields come straight from pymatgen and are already the right types
+        return cls.model_construct(
             titel=potcar_single.symbol,
             hash=potcar_single.md5_header_hash,
             summary_stats=potcar_single._summary_stats,
@@ -121,7 +137,8 @@ class PotcarSpec(BaseModel):
         list[PotcarSpec]
             A list of potcar specs.
         """
-        return [cls.from_potcar_single(p) for p in potcar]
+        from_potcar_single = cls.from_potcar_single
+        return [from_potcar_single(p) for p in potcar]
 
 
 class CalculationInput(CalculationBaseModel):
@@ -170,12 +187,6 @@ class CalculationInput(CalculationBaseModel):
         CalculationInput
             The input document.
         """
-        kpoints_dict = vasprun.kpoints.as_dict()
-        kpoints_dict["actual_kpoints"] = [
-            {"abc": list(k), "weight": w}
-            for k, w in zip(vasprun.actual_kpoints, vasprun.actual_kpoints_weights)
-        ]
-
         parameters = dict(vasprun.parameters).copy()
         incar = dict(vasprun.incar)
         if metagga := incar.get("METAGGA"):
@@ -183,14 +194,18 @@ class CalculationInput(CalculationBaseModel):
             # INCAR field of vasprun.xml, and not parameters
             parameters.update({"METAGGA": metagga})
 
-        return cls(
+        potcar = [s.split(None, 1)[0] for s in vasprun.potcar_symbols]
+
+        # inputs are parsed by pymatgen so skip validation; only the nested
+        # KPOINTS and POTCAR specs need converting from dictionaries
+        return cls.model_construct(
             structure=vasprun.initial_structure,
             incar=incar,
-            kpoints=kpoints_dict,
-            nkpoints=len(kpoints_dict["actual_kpoints"]),
-            potcar=[s.split()[0] for s in vasprun.potcar_symbols],
-            potcar_spec=vasprun.potcar_spec,
-            potcar_type=[s.split()[0] for s in vasprun.potcar_symbols],
+            kpoints=Kpoints.from_dict(vasprun.kpoints.as_dict()),
+            nkpoints=len(vasprun.actual_kpoints),
+            potcar=potcar,
+            potcar_spec=[PotcarSpec(**spec) for spec in vasprun.potcar_spec],
+            potcar_type=list(potcar),
             parameters=parameters,
             lattice_rec=vasprun.initial_structure.lattice.reciprocal_lattice,
             is_hubbard=vasprun.is_hubbard,
@@ -211,6 +226,8 @@ class RunStatistics(BaseModel):
     total_time: float = Field(0, description="The total CPU time for this calculation")
     cores: int = Field(0, description="The number of cores used by VASP")
 
+    model_config = ConfigDict(frozen=True)
+
     @classmethod
     def from_outcar(cls, outcar: Outcar) -> "RunStatistics":
         """
@@ -226,28 +243,16 @@ class RunStatistics(BaseModel):
         RunStatistics
             The run statistics.
         """
-        # rename these statistics
-        mapping = {
-            "Average memory used (kb)": "average_memory",
-            "Maximum memory used (kb)": "max_memory",
-            "Elapsed time (sec)": "elapsed_time",
-            "System time (sec)": "system_time",
-            "User time (sec)": "user_time",
-            "Total CPU time used (sec)": "total_time",
-            "cores": "cores",
-        }
-        run_stats = {}
-        for k, v in mapping.items():
-            stat = outcar.run_stats.get(k) or 0
-            try:
-                stat = float(stat)
-            except ValueError:
-                # sometimes the statistics are misformatted
-                stat = 0
-
-            run_stats[v] = stat
-
-        return cls(**run_stats)
+        run_stats = outcar.run_stats
+        return cls.model_construct(
+            average_memory=_parse_run_stat(run_stats.get("Average memory used (kb)")),
+            max_memory=_parse_run_stat(run_stats.get("Maximum memory used (kb)")),
+            elapsed_time=_parse_run_stat(run_stats.get("Elapsed time (sec)")),
+            system_time=_parse_run_stat(run_stats.get("System time (sec)")),
+            user_time=_parse_run_stat(run_stats.get("User time (sec)")),
+            total_time=_parse_run_stat(run_stats.get("Total CPU time used (sec)")),
+            cores=int(_parse_run_stat(run_stats.get("cores"))),
+        )
 
 
 class FrequencyDependentDielectric(BaseModel):
@@ -286,7 +291,7 @@ class FrequencyDependentDielectric(BaseModel):
             A frequency-dependent dielectric document.
         """
         energy, real, imag = vasprun.dielectric
-        return cls(real=real, imaginary=imag, energy=energy)
+        return cls.model_construct(real=real, imaginary=imag, energy=energy)
 
 
 class ElectronPhononDisplacedStructures(BaseModel):
@@ -325,7 +330,7 @@ class ElectronicStep(BaseModel):  # type: ignore
     e_wo_entrp: Optional[float] = Field(None, description="The energy without entropy.")
     e_0_energy: Optional[float] = Field(None, description="The internal energy.")
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class IonicStep(BaseModel):  # type: ignore
@@ -345,7 +350,7 @@ class IonicStep(BaseModel):  # type: ignore
         None, description="The structure at this step."
     )
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class CalculationOutput(BaseModel):
@@ -488,14 +493,15 @@ class CalculationOutput(BaseModel):
         try:
             bandstructure = vasprun.get_band_structure(efermi="smart")
             bandgap_info = bandstructure.get_band_gap()
+            # validation is skipped below, so cast numpy scalars to float here
             electronic_output = dict(
-                efermi=bandstructure.efermi,
-                vbm=bandstructure.get_vbm()["energy"],
-                cbm=bandstructure.get_cbm()["energy"],
-                bandgap=bandgap_info["energy"],
+                efermi=_optional_float(bandstructure.efermi),
+                vbm=_optional_float(bandstructure.get_vbm()["energy"]),
+                cbm=_optional_float(bandstructure.get_cbm()["energy"]),
+                bandgap=_optional_float(bandgap_info["energy"]),
                 is_gap_direct=bandgap_info["direct"],
                 is_metal=bandstructure.is_metal(),
-                direct_gap=bandstructure.get_direct_band_gap(),
+                direct_gap=_optional_float(bandstructure.get_direct_band_gap()),
                 transition=bandgap_info["transition"],
             )
         except Exception:
@@ -504,24 +510,34 @@ class CalculationOutput(BaseModel):
                 logger.warning("VASP doesn't properly output efermi for IBRION == 1")
             electronic_output = {}
 
-        freq_dependent_diel: Union[dict, FrequencyDependentDielectric] = {}
         try:
             freq_dependent_diel = FrequencyDependentDielectric.from_vasprun(vasprun)
         except KeyError:
-            pass
+            freq_dependent_diel = FrequencyDependentDielectric.model_construct()
 
         locpot_avg = None
         if locpot:
+            # planar averages along each lattice vector; equivalent to
+            # locpot.get_average_along_axis(i) but sweeps the grid twice, not 3x
+            grid = locpot.data["total"]
+            n0, n1, n2 = grid.shape
+            plane_sum = grid.sum(axis=0)
             locpot_avg = {
-                i: locpot.get_average_along_axis(i).tolist() for i in range(3)
+                0: (grid.sum(axis=(1, 2)) / (n1 * n2)).tolist(),
+                1: (plane_sum.sum(axis=1) / (n0 * n2)).tolist(),
+                2: (plane_sum.sum(axis=0) / (n0 * n1)).tolist(),
             }
 
         # parse force constants
         phonon_output = {}
         if hasattr(vasprun, "force_constants"):
-            # convert eigenvalues to frequency
-            eigs = -vasprun.normalmode_eigenvals
-            frequencies = np.sqrt(np.abs(eigs)) * np.sign(eigs)
+            # convert eigenvalues to frequency, i.e. sqrt(|eig|) * sign(-eig);
+            # done in-place on a single buffer as the mode count can be large
+            eigs = np.asarray(vasprun.normalmode_eigenvals)
+            frequencies = np.abs(eigs)
+            np.sqrt(frequencies, out=frequencies)
+            np.copysign(frequencies, eigs, out=frequencies)
+            np.negative(frequencies, out=frequencies)
 
             # convert to THz in VASP 5 and lower; VASP 6 uses THz internally
             major_version = int(vasprun.vasp_version.split(".")[0])
@@ -542,9 +558,11 @@ class CalculationOutput(BaseModel):
                 outcar_dict.pop("onsite_density_matrices")
             # use structure from CONTCAR as it is written to
             # greater precision than in the vasprun
-            # but still need to copy the charge over
-            structure = contcar.structure
-            structure._charge = vasprun.final_structure._charge
+            # but still need to copy the charge over; copy the structure so the
+            # Poscar passed in is not modified
+            structure = contcar.structure.copy()
+            if (charge := vasprun.final_structure._charge) is not None:
+                structure._charge = charge
 
             mag_density = (
                 outcar.total_mag / structure.volume if outcar.total_mag else None
@@ -563,32 +581,43 @@ class CalculationOutput(BaseModel):
             mag_density = None
 
         # Parse DOS properties
+        lorbit = vasprun.parameters.get("LORBIT", 0)
+        complete_dos = _get_complete_dos(vasprun) if lorbit >= 11 else None
         dosprop_dict = (
-            _get_band_props(vasprun.complete_dos, structure)
-            if hasattr(vasprun, "complete_dos") and vasprun.parameters["LORBIT"] >= 11
-            else {}
+            _get_band_props(complete_dos, structure) if complete_dos is not None else {}
         )
 
         elph_structures: Dict[str, List[Any]] = {}
         if elph_poscars is not None:
-            elph_structures.update({"temperatures": [], "structures": []})
-            for elph_poscar in elph_poscars:
-                temp = str(elph_poscar.name).replace("POSCAR.T=", "").replace(".gz", "")
-                elph_structures["temperatures"].append(temp)
-                elph_structures["structures"].append(Structure.from_file(elph_poscar))
-        return cls(
+            temperatures = [
+                float(_ELPH_POSCAR_RE.match(elph_poscar.name).group(1))
+                for elph_poscar in elph_poscars
+            ]
+            # the displaced POSCARs are independent files so read them concurrently
+            with ThreadPoolExecutor(
+                max_workers=min(8, max(len(elph_poscars), 1))
+            ) as executor:
+                structures = list(executor.map(Structure.from_file, elph_poscars))
+            elph_structures.update(
+                {"temperatures": temperatures, "structures": structures}
+            )
+        # outputs are parsed by pymatgen so skip validation; nested documents
+        # built from dictionaries are still validated
+        return cls.model_construct(
             structure=structure,
-            energy=vasprun.final_energy,
-            energy_per_atom=vasprun.final_energy / len(structure),
+            energy=float(vasprun.final_energy),
+            energy_per_atom=float(vasprun.final_energy) / len(structure),
             mag_density=mag_density,
             epsilon_static=vasprun.epsilon_static or None,
             epsilon_static_wolfe=vasprun.epsilon_static_wolfe or None,
             epsilon_ionic=vasprun.epsilon_ionic or None,
             frequency_dependent_dielectric=freq_dependent_diel,
-            elph_displaced_structures=elph_structures,
+            elph_displaced_structures=ElectronPhononDisplacedStructures(
+                **elph_structures
+            ),
             dos_properties=dosprop_dict,
             ionic_steps=(
-                vasprun.ionic_steps
+                [IonicStep(**step) for step in vasprun.ionic_steps]
                 if store_trajectory == StoreTrajectoryOption.NO
                 else None
             ),
@@ -663,6 +692,8 @@ class Calculation(CalculationBaseModel):
         store_trajectory: StoreTrajectoryOption = StoreTrajectoryOption.NO,
         store_onsite_density_matrices: bool = False,
         vasprun_kwargs: Optional[Dict] = None,
+        use_cache: bool = False,
+        cache_dir: Optional[Union[Path, str]] = None,
     ) -> Tuple["Calculation", Dict[VaspObject, Dict]]:
         """
         Create a VASP calculation document from a directory and file paths.
@@ -740,6 +771,15 @@ class Calculation(CalculationBaseModel):
             Whether to store the onsite density matrices from the OUTCAR.
         vasprun_kwargs
             Additional keyword arguments that will be passed to the Vasprun init.
+        use_cache
+            Whether to store the parsed calculation in a pickle file and reuse it on
+            later calls while the VASP output files, parsing options, and
+            emmet/pymatgen versions are unchanged. Volumetric data is not cached and
+            is read from its files on every call. Only enable this for directories
+            you trust, as the cache is loaded with pickle.
+        cache_dir
+            The directory to write the cache file to when ``use_cache`` is set.
+            Defaults to dir_name.
 
         Returns
         -------
@@ -753,15 +793,52 @@ class Calculation(CalculationBaseModel):
 
         vasprun_kwargs = vasprun_kwargs if vasprun_kwargs else {}
         volumetric_files = [] if volumetric_files is None else volumetric_files
-        vasprun = Vasprun(vasprun_file, **vasprun_kwargs)
-        outcar = Outcar(outcar_file)
+
+        if use_cache:
+            cache_file = _calc_cache_path(dir_name, task_name, cache_dir)
+            fingerprint = _calc_cache_fingerprint(
+                [
+                    vasprun_file,
+                    outcar_file,
+                    contcar_file,
+                    oszicar_file,
+                    *(dir_name / f for f in volumetric_files),
+                    *(elph_poscars or []),
+                ],
+                (
+                    task_name,
+                    parse_dos,
+                    parse_bandstructure,
+                    average_locpot,
+                    run_bader,
+                    run_ddec6,
+                    strip_bandstructure_projections,
+                    strip_dos_projections,
+                    store_volumetric_data,
+                    store_trajectory,
+                    store_onsite_density_matrices,
+                    vasprun_kwargs,
+                ),
+            )
+            if (cached := _load_calc_cache(cache_file, fingerprint)) is not None:
+                calc_doc, cached_objects = cached
+                vasp_objects = _get_volumetric_data(
+                    dir_name,
+                    _get_output_file_paths(volumetric_files),
+                    store_volumetric_data,
+                )
+                vasp_objects.update(cached_objects)
+                return calc_doc, vasp_objects
+
+        vasprun = _read_vasp_file(Vasprun, vasprun_file, **vasprun_kwargs)
+        outcar = _read_vasp_file(Outcar, outcar_file)
         if (
             os.path.getsize(contcar_file) == 0
             and vasprun.parameters.get("NELM", 60) == 1
         ):
             contcar = Poscar(vasprun.final_structure)
         else:
-            contcar = Poscar.from_file(contcar_file)
+            contcar = _read_vasp_file(Poscar.from_file, contcar_file)
         completed_at = str(datetime.fromtimestamp(vasprun_file.stat().st_mtime))
 
         output_file_paths = _get_output_file_paths(volumetric_files)
@@ -769,10 +846,8 @@ class Calculation(CalculationBaseModel):
             dir_name, output_file_paths, store_volumetric_data
         )
 
-        dos = _parse_dos(parse_dos, vasprun)
+        dos = _parse_dos(parse_dos, vasprun, strip_projections=strip_dos_projections)
         if dos is not None:
-            if strip_dos_projections:
-                dos = Dos(dos.efermi, dos.energies, dos.densities)
             vasp_objects[VaspObject.DOS] = dos  # type: ignore
 
         bandstructure = _parse_bandstructure(parse_bandstructure, vasprun)
@@ -783,11 +858,15 @@ class Calculation(CalculationBaseModel):
 
         bader = None
         if run_bader and VaspObject.CHGCAR in output_file_paths:
+            from pymatgen.command_line.bader_caller import bader_analysis_from_path
+
             suffix = "" if task_name == "standard" else f".{task_name}"
             bader = bader_analysis_from_path(dir_name, suffix=suffix)
 
         ddec6 = None
         if run_ddec6 and VaspObject.CHGCAR in output_file_paths:
+            from pymatgen.command_line.chargemol_caller import ChargemolAnalysis
+
             densities_path = run_ddec6 if isinstance(run_ddec6, (str, Path)) else None
             ddec6 = ChargemolAnalysis(
                 path=dir_name, atomic_densities_path=densities_path
@@ -816,13 +895,24 @@ class Calculation(CalculationBaseModel):
             exclude_from_trajectory = ["structure"]
             if store_trajectory == StoreTrajectoryOption.PARTIAL:
                 exclude_from_trajectory.append("electronic_steps")
-            frame_properties = [
-                IonicStep(**x).model_dump(exclude=exclude_from_trajectory)
-                for x in vasprun.ionic_steps
-            ]
+            # equivalent to IonicStep(**x).model_dump(exclude=...) without
+            # validating every ionic and electronic step of long MD runs
+            ionic_step_fields = dict.fromkeys(IonicStep.model_fields)
+            electronic_step_fields = dict.fromkeys(ElectronicStep.model_fields)
+            frame_properties = []
+            for ionic_step in vasprun.ionic_steps:
+                frame = {**ionic_step_fields, **ionic_step}
+                for key in exclude_from_trajectory:
+                    frame.pop(key, None)
+                if frame.get("electronic_steps") is not None:
+                    frame["electronic_steps"] = [
+                        {**electronic_step_fields, **electronic_step}
+                        for electronic_step in frame["electronic_steps"]
+                    ]
+                frame_properties.append(frame)
             if oszicar_file:
                 try:
-                    oszicar = Oszicar(oszicar_file)
+                    oszicar = _read_vasp_file(Oszicar, oszicar_file)
                     if "T" in oszicar.ionic_steps[0]:
                         for frame_property, oszicar_is in zip(
                             frame_properties, oszicar.ionic_steps
@@ -851,7 +941,9 @@ class Calculation(CalculationBaseModel):
                 TaskState.SUCCESS if vasprun.converged else TaskState.FAILED
             )
 
-        return (
+        # task type only depends on the INCAR and KPOINTS
+        task_inputs = {"incar": input_doc.incar, "kpoints": input_doc.kpoints}
+        calc = (
             cls(
                 dir_name=str(dir_name),
                 task_name=task_name,
@@ -866,11 +958,14 @@ class Calculation(CalculationBaseModel):
                 bader=bader,
                 ddec6=ddec6,
                 run_type=run_type(input_doc.parameters),
-                task_type=task_type(input_doc.model_dump()),
-                calc_type=calc_type(input_doc.model_dump(), input_doc.parameters),
+                task_type=task_type(task_inputs),
+                calc_type=calc_type(task_inputs, input_doc.parameters),
             ),
             vasp_objects,
         )
+        if use_cache:
+            _dump_calc_cache(cache_file, fingerprint, calc)
+        return calc
 
     @classmethod
     def from_vasprun(
@@ -922,6 +1017,8 @@ class Calculation(CalculationBaseModel):
                 TaskState.SUCCESS if vasprun.converged else TaskState.FAILED
             )
 
+        # task type only depends on the INCAR and KPOINTS
+        task_inputs = {"incar": input_doc.incar, "kpoints": input_doc.kpoints}
         return cls(
             dir_name=str(path.resolve().parent),
             task_name=task_name,
@@ -932,11 +1029,205 @@ class Calculation(CalculationBaseModel):
             output=output_doc,
             output_file_paths={},
             run_type=run_type(input_doc.parameters),
-            task_type=task_type(input_doc.model_dump()),
-            calc_type=calc_type(input_doc.model_dump(), input_doc.parameters),
+            task_type=task_type(task_inputs),
+            calc_type=calc_type(task_inputs, input_doc.parameters),
         )
 
 
+_parse_cache: Optional["OrderedDict[Tuple, bytes]"] = None
+_parse_cache_maxsize = 0
+
+
+@contextmanager
+def parse_cache(maxsize: int = 8) -> Iterator[None]:
+    """
+    Reuse parsed VASP output files within a block.
+
+    While the block is active, ``Calculation.from_vasp_files`` only parses each
+    unmodified vasprun.xml, OUTCAR, CONTCAR, and OSZICAR file once. The parsed
+    objects are kept pickled, so every call still receives its own copy. The
+    cache is dropped when the block exits.
+
+    Parameters
+    ----------
+    maxsize
+        The maximum number of parsed files to keep.
+    """
+    global _parse_cache, _parse_cache_maxsize
+    previous = _parse_cache, _parse_cache_maxsize
+    _parse_cache, _parse_cache_maxsize = OrderedDict(), maxsize
+    try:
+        yield
+    finally:
+        _parse_cache, _parse_cache_maxsize = previous
+
+
+def _read_vasp_file(parser: Callable, path: Union[Path, str], **kwargs) -> Any:
+    """
+    Parse a VASP file, reusing an earlier parse inside a ``parse_cache`` block.
+
+    Parameters
+    ----------
+    parser
+        The pymatgen parser, e.g. ``Vasprun`` or ``Poscar.from_file``.
+    path
+        The path to the file.
+    **kwargs
+        Keyword arguments passed to the parser.
+
+    Returns
+    -------
+    Any
+        The parsed object.
+    """
+    path = Path(path)
+    if _parse_cache is None:
+        return parser(path, **kwargs)
+
+    stat = path.stat()
+    key = (
+        parser,
+        str(path.resolve()),
+        stat.st_mtime_ns,
+        stat.st_size,
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        cached = _parse_cache.get(key)
+    except TypeError:
+        # unhashable parser options, e.g. lists, cannot be cached
+        return parser(path, **kwargs)
+
+    if cached is not None:
+        _parse_cache.move_to_end(key)
+        return pickle.loads(cached)
+
+    parsed = parser(path, **kwargs)
+    try:
+        _parse_cache[key] = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return parsed
+    if len(_parse_cache) > _parse_cache_maxsize:
+        _parse_cache.popitem(last=False)
+    return parsed
+
+
+def _calc_cache_path(
+    dir_name: Path, task_name: str, cache_dir: Optional[Union[Path, str]]
+) -> Path:
+    """
+    Get the path of the cache file for a calculation.
+
+    Parameters
+    ----------
+    dir_name
+        The directory containing the calculation outputs.
+    task_name
+        The task name.
+    cache_dir
+        The directory for cache files, or None to use dir_name.
+
+    Returns
+    -------
+    Path
+        The cache file path.
+    """
+    if cache_dir is None:
+        return dir_name / f".emmet_calc_cache_{task_name}.pkl"
+    # a shared cache directory holds many calculations, so key on the source
+    dir_hash = hashlib.sha1(str(dir_name.resolve()).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"emmet_calc_cache_{dir_hash}_{task_name}.pkl"
+
+
+def _calc_cache_fingerprint(
+    files: List[Optional[Union[Path, str]]], options: Tuple
+) -> Tuple:
+    """
+    Get a key identifying a parsed calculation from its files and options.
+
+    Parameters
+    ----------
+    files
+        The VASP files that are parsed; missing files are skipped.
+    options
+        The parsing options used.
+
+    Returns
+    -------
+    Tuple
+        The file paths, modification times and sizes, parsing options, and the
+        emmet/pymatgen versions.
+    """
+    file_stats = []
+    for f in files:
+        if f is None or not Path(f).exists():
+            continue
+        stat = Path(f).stat()
+        file_stats.append((str(f), stat.st_mtime_ns, stat.st_size))
+    return (tuple(file_stats), repr(options), __version__, pmg_version)
+
+
+def _load_calc_cache(
+    cache_file: Path, fingerprint: Tuple
+) -> Optional[Tuple["Calculation", Dict[VaspObject, Any]]]:
+    """Load a cached calculation if it was written with a matching fingerprint."""
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        logger.warning(f"Could not load calculation cache {cache_file}")
+        return None
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+    return cached["calc"], cached["vasp_objects"]
+
+
+def _dump_calc_cache(
+    cache_file: Path,
+    fingerprint: Tuple,
+    calc: Tuple["Calculation", Dict[VaspObject, Any]],
+) -> None:
+    """
+    Write a parsed calculation to the cache.
+
+    Volumetric data can be hundreds of MB and is cheap to read again from its own
+    files, so it is left out of the cache.
+    """
+    vasp_objects = {
+        k: v for k, v in calc[1].items() if not isinstance(v, VolumetricData)
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(
+                {
+                    "fingerprint": fingerprint,
+                    "calc": calc[0],
+                    "vasp_objects": vasp_objects,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except Exception:
+        logger.warning(f"Could not write calculation cache {cache_file}")
+
+
+def _parse_run_stat(stat: Any) -> float:
+    """Convert an OUTCAR run statistic to a float, using 0 if it is missing."""
+    try:
+        return float(stat or 0)
+    except ValueError:
+        # sometimes the statistics are misformatted
+        return 0.0
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    """Convert a (numpy) number to a float, leaving None unchanged."""
+    return None if value is None else float(value)
+
+
 def _get_output_file_paths(volumetric_files: List[str]) -> Dict[VaspObject, str]:
     """
     Get the output file paths for VASP output files from the list of volumetric files.
@@ -951,12 +1242,12 @@ def _get_output_file_paths(volumetric_files: List[str]) -> Dict[VaspObject, str]
     Dict[VaspObject, str]
         A mapping between the VASP object type and the file path.
     """
-    output_file_paths = {}
-    for vasp_object in VaspObject:  # type: ignore
-        for volumetric_file in volumetric_files:
-            if vasp_object.name in str(volumetric_file):
-                output_file_paths[vasp_object] = str(volumetric_file)
-    return output_file_paths
+    found = {}
+    for volumetric_file in volumetric_files:
+        volumetric_file = str(volumetric_file)
+        for name in _VASP_OBJECT_NAME_RE.findall(volumetric_file):
+            found[_VASP_OBJECT_BY_NAME[name]] = volumetric_file
+    return {obj: found[obj] for obj in VaspObject if obj in found}  # type: ignore
 
 
 def _get_volumetric_data(
@@ -990,41 +1281,105 @@ def _get_volumetric_data(
     if store_volumetric_data is None or len(store_volumetric_data) == 0:
         return {}
 
+    # enum values are the lowercase names, so one normalized set matches both
+    wanted = frozenset(s.upper() for s in store_volumetric_data)
+
     volumetric_data = {}
     for file_type, file in output_file_paths.items():
-        if (
-            file_type.name not in store_volumetric_data
-            and file_type.value not in store_volumetric_data
-        ):
+        if file_type.name not in wanted:
             continue
 
         try:
             # assume volumetric data is all in CHGCAR format
             volumetric_data[file_type] = Chgcar.from_file(dir_name / file)
-        except Exception:
-            raise ValueError(f"Failed to parse {file_type} at {file}.")
+        except Exception as e:
+            raise ValueError(f"Failed to parse {file_type} at {file}.") from e
     return volumetric_data
 
 
-def _parse_dos(parse_mode: Union[str, bool], vasprun: Vasprun) -> Optional[Dos]:
+def _get_complete_dos(vasprun: Vasprun) -> Optional[CompleteDos]:
+    """
+    Get the complete DOS of a vasprun, building it at most once.
+
+    ``Vasprun.complete_dos`` aggregates the site projections on every access, so
+    the result is stored on the vasprun and shared between the DOS parsing and
+    the DOS band properties.
+
+    Parameters
+    ----------
+    vasprun
+        A vasprun object.
+
+    Returns
+    -------
+    Optional[CompleteDos]
+        The complete DOS, or None if the vasprun has no DOS.
+    """
+    if not hasattr(vasprun, "_emmet_complete_dos"):
+        try:
+            vasprun._emmet_complete_dos = vasprun.complete_dos
+        except AttributeError:
+            vasprun._emmet_complete_dos = None
+    return vasprun._emmet_complete_dos
+
+
+def _parse_dos(
+    parse_mode: Union[str, bool], vasprun: Vasprun, strip_projections: bool = False
+) -> Optional[Dos]:
     """Parse DOS. See Calculation.from_vasp_files for supported arguments."""
     nsw = vasprun.incar.get("NSW", 0)
     dos = None
     if parse_mode is True or (parse_mode == "auto" and nsw < 1):
-        dos = vasprun.complete_dos
+        if strip_projections:
+            # only the total DOS is kept, so skip aggregating the projections
+            tdos = vasprun.tdos
+            dos = Dos(tdos.efermi, tdos.energies, tdos.densities)
+        else:
+            dos = _get_complete_dos(vasprun)
     return dos
 
 
+def _get_bs_vasprun(
+    vasprun: Vasprun, parse_projected_eigen: bool
+) -> Union[Vasprun, BSVasprun]:
+    """
+    Get a vasprun with the eigenvalues needed to build a band structure.
+
+    The already parsed vasprun is reused if it holds the (projected) eigenvalues,
+    otherwise the file is parsed again with BSVasprun. A reused vasprun may hold
+    projections even if they are not needed. Inside a ``parse_cache`` block the
+    BSVasprun parse is shared between calls, each receiving its own copy.
+
+    Parameters
+    ----------
+    vasprun
+        The parsed vasprun.
+    parse_projected_eigen
+        Whether projected eigenvalues are needed.
+
+    Returns
+    -------
+    Union[Vasprun, BSVasprun]
+        A vasprun that can generate the band structure.
+    """
+    if getattr(vasprun, "eigenvalues", None) is not None and (
+        not parse_projected_eigen
+        or getattr(vasprun, "projected_eigenvalues", None) is not None
+    ):
+        return vasprun
+    return _read_vasp_file(
+        BSVasprun, vasprun.filename, parse_projected_eigen=parse_projected_eigen
+    )
+
+
 def _parse_bandstructure(
     parse_mode: Union[str, bool], vasprun: Vasprun
 ) -> Optional[BandStructure]:
     """Parse band structure. See Calculation.from_vasp_files for supported arguments."""
-    vasprun_file = vasprun.filename
-
     if parse_mode == "auto":
         if vasprun.incar.get("ICHARG", 0) > 10:
             # NSCF calculation
-            bs_vrun = BSVasprun(vasprun_file, parse_projected_eigen=True)
+            bs_vrun = _get_bs_vasprun(vasprun, parse_projected_eigen=True)
             try:
                 # try parsing line mode
                 bs = bs_vrun.get_band_structure(line_mode=True, efermi="smart")
@@ -1033,8 +1388,10 @@ def _parse_bandstructure(
                 bs = bs_vrun.get_band_structure(efermi="smart")
         else:
             # Not a NSCF calculation
-            bs_vrun = BSVasprun(vasprun_file, parse_projected_eigen=False)
+            bs_vrun = _get_bs_vasprun(vasprun, parse_projected_eigen=False)
             bs = bs_vrun.get_band_structure(efermi="smart")
+            # the reused vasprun may hold projections, which are not stored here
+            bs.projections = {}
 
         # only save the bandstructure if not moving ions
         if vasprun.incar.get("NSW", 0) <= 1:
@@ -1042,13 +1399,60 @@ def _parse_bandstructure(
 
     elif parse_mode:
         # legacy line/True behavior for bandstructure_mode
-        bs_vrun = BSVasprun(vasprun_file, parse_projected_eigen=True)
+        bs_vrun = _get_bs_vasprun(vasprun, parse_projected_eigen=True)
         bs = bs_vrun.get_band_structure(line_mode=parse_mode == "line", efermi="smart")
         return bs
 
     return None
 
 
+def _get_dos_props(dos: Dos) -> Dict[str, float]:
+    """
+    Calculate the band properties of a projected DOS.
+
+    Equivalent to the ``CompleteDos.get_band_filling``, ``get_band_center``,
+    ``get_band_width``, ``get_band_skewness``, ``get_band_kurtosis`` and
+    ``get_upper_band_edge`` methods, but computes all moments from a single
+    projection rather than re-projecting the DOS for each property.
+
+    Parameters
+    ----------
+    dos
+        An element and orbital projected DOS.
+
+    Returns
+    -------
+    Dict
+        The band filling, center, width, skewness, kurtosis, and upper edge.
+    """
+    from scipy.integrate import trapezoid
+    from scipy.signal import hilbert
+
+    energies = dos.energies - dos.efermi
+    densities = dos.get_densities()
+    norm = trapezoid(densities, x=energies)
+
+    occupied = energies < 0
+    filling = trapezoid(densities[occupied], x=energies[occupied]) / norm
+    center = trapezoid(energies * densities, x=energies) / norm
+    shifted = energies - center
+    moment_2 = trapezoid(shifted**2 * densities, x=energies) / norm
+    moment_3 = trapezoid(shifted**3 * densities, x=energies) / norm
+    moment_4 = trapezoid(shifted**4 * densities, x=energies) / norm
+
+    # upper band edge is the highest peak of the Hilbert transformed DOS
+    transformed = sum(np.imag(hilbert(d)) for d in dos.densities.values())
+
+    return {
+        "filling": float(filling),
+        "center": float(center),
+        "bandwidth": float(np.sqrt(moment_2)),
+        "skewness": float(moment_3 / moment_2 ** (3 / 2)),
+        "kurtosis": float(moment_4 / moment_2**2),
+        "upper_edge": float(energies[np.argmax(transformed)]),
+    }
+
+
 def _get_band_props(
     complete_dos: CompleteDos, structure: Structure
 ) -> Dict[str, Dict[str, Dict[str, float]]]:
@@ -1071,6 +1475,7 @@ def _get_band_props(
     for el in structure.composition.elements:
         el_name = el.name
         dosprop_dict[el_name] = {}
+        spd_dos = None
         for orb_type in [
             OrbitalType.s,
             OrbitalType.p,
@@ -1083,20 +1488,9 @@ def _get_band_props(
                 or (el.block == "d" and orb_name == "f")
             ):
                 continue
-            dosprops = {
-                "filling": complete_dos.get_band_filling(band=orb_type, elements=[el]),
-                "center": complete_dos.get_band_center(band=orb_type, elements=[el]),
-                "bandwidth": complete_dos.get_band_width(band=orb_type, elements=[el]),
-                "skewness": complete_dos.get_band_skewness(
-                    band=orb_type, elements=[el]
-                ),
-                "kurtosis": complete_dos.get_band_kurtosis(
-                    band=orb_type, elements=[el]
-                ),
-                "upper_edge": complete_dos.get_upper_band_edge(
-                    band=orb_type, elements=[el]
-                ),
-            }
-            dosprop_dict[el_name][orb_name] = dosprops
+            if spd_dos is None:
+                # projecting onto an element sums over all its sites, so only do it once
+                spd_dos = complete_dos.get_element_spd_dos(el)
+            dosprop_dict[el_name][orb_name] = _get_dos_props(spd_dos[orb_type])
 
     return dosprop_dict
@@ -1,6 +1,6 @@
-import json
 import datetime
 
+import orjson
 import pytest
 
 from monty.io import zopen
@@ -11,13 +11,11 @@ from emmet.core.molecules.vibration import VibrationDoc
 
 @pytest.fixture(scope="session")
 def test_tasks(test_dir):
-    with zopen(test_dir / "liec_tasks.json.gz") as f:
-        data = json.load(f)
+    with zopen(test_dir / "liec_tasks.json.gz", "rb") as f:
+        data = orjson.loads(f.read())
 
     for d in data:
-        d["last_updated"] = datetime.datetime.strptime(
-            d["last_updated"]["string"], "%Y-%m-%d %H:%M:%S.%f"
-        )
+        d["last_updated"] = datetime.datetime.fromisoformat(d["last_updated"]["string"])
 
     tasks = [TaskDocument(**t) for t in data]
     return tasks
@@ -25,11 +23,11 @@ def test_tasks(test_dir):
 
 @pytest.fixture(scope="session")
 def raman_task(test_dir):
-    with zopen(test_dir / "raman_task.json.gz") as f:
-        data = json.load(f)
+    with zopen(test_dir / "raman_task.json.gz", "rb") as f:
+        data = orjson.loads(f.read())
 
-    data["last_updated"] = datetime.datetime.strptime(
-        data["last_updated"]["string"], "%Y-%m-%d %H:%M:%S.%f"
+    data["last_updated"] = datetime.datetime.fromisoformat(
+        data["last_updated"]["string"]
     )
 
     task = TaskDocument(**data)
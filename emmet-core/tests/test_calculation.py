@@ -79,6 +79,14 @@ def test_calculation_output(test_dir, object_name, task_name):
     assert_schemas_equal(test_doc, valid_doc)
     assert test_doc.efermi == vasprun.get_band_structure(efermi="smart").efermi
 
+    # numpy scalars are not JSON serializable by orjson, which maggma stores use
+    d = test_doc.model_dump()
+    for key in ("energy", "efermi", "vbm", "cbm", "bandgap", "direct_gap"):
+        assert d[key] is None or type(d[key]) is float
+    for orbitals in d["dos_properties"].values():
+        for props in orbitals.values():
+            assert all(type(v) is float for v in props.values())
+
     # test document can be jsanitized
     d = jsanitize(test_doc, strict=True, enum_values=True, allow_bson=True)
 
@@ -204,3 +212,234 @@ def test_PotcarSpec(test_dir):
     except (OSError, ValueError):
         # missing Pymatgen POTCARs, cannot perform test
         assert True
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_calculation_repeated_parses_independent(test_dir, cached):
+    from contextlib import nullcontext
+
+    from emmet.core.vasp.calculation import Calculation, parse_cache
+
+    test_object = get_test_object("SiStatic")
+    dir_name = test_dir / "vasp" / test_object.folder
+    files = test_object.task_files["standard"]
+
+    with parse_cache() if cached else nullcontext():
+        calc1, _ = Calculation.from_vasp_files(dir_name, "standard", **files)
+        calc1.output.structure.replace(0, "Ge")
+        calc1.input.structure.replace(0, "Ge")
+        calc2, _ = Calculation.from_vasp_files(dir_name, "standard", **files)
+
+    assert calc2.output.structure is not calc1.output.structure
+    assert calc2.output.structure.composition.reduced_formula == "Si"
+    assert calc2.input.structure.composition.reduced_formula == "Si"
+    assert set(calc2.output.dos_properties) == {"Si"}
+
+
+def test_parse_cache_bandstructure_and_oszicar(test_dir):
+    from pymatgen.io.vasp import BSVasprun, Oszicar
+
+    from emmet.core.vasp.calculation import (
+        Calculation,
+        VaspObject,
+        _read_vasp_file,
+        parse_cache,
+    )
+
+    test_object = get_test_object("SiNonSCFUniform")
+    dir_name = test_dir / "vasp" / test_object.folder
+    files = test_object.task_files["standard"]
+
+    _, objects = Calculation.from_vasp_files(
+        dir_name, "standard", parse_bandstructure=True, **files
+    )
+    with parse_cache():
+        bs_vruns = [
+            _read_vasp_file(
+                BSVasprun, dir_name / files["vasprun_file"], parse_projected_eigen=True
+            )
+            for _ in range(2)
+        ]
+        oszicars = [
+            _read_vasp_file(Oszicar, test_dir / "vasp" / "defect_run" / "OSZICAR.gz")
+            for _ in range(2)
+        ]
+        _, cached_objects = Calculation.from_vasp_files(
+            dir_name, "standard", parse_bandstructure=True, **files
+        )
+
+    assert bs_vruns[0] is not bs_vruns[1]
+    assert bs_vruns[0].projected_eigenvalues is not bs_vruns[1].projected_eigenvalues
+    assert oszicars[0] is not oszicars[1]
+    assert oszicars[0].ionic_steps == oszicars[1].ionic_steps
+
+    bs = objects[VaspObject.BANDSTRUCTURE]
+    cached_bs = cached_objects[VaspObject.BANDSTRUCTURE]
+    assert cached_bs.projections.keys() == bs.projections.keys()
+    assert cached_bs.as_dict() == bs.as_dict()
+
+
+def test_calculation_output_array_fields(test_dir):
+    import numpy as np
+    from pymatgen.io.vasp import Locpot, Outcar, Poscar, Vasprun
+
+    from emmet.core.vasp.calculation import CalculationOutput
+
+    doc = CalculationOutput(
+        force_constants=np.ones((2, 2, 3, 3)).tolist(),
+        normalmode_frequencies=[1.0, 2.0],
+        normalmode_eigenvals=[1.0, 2.0],
+        normalmode_eigenvecs=np.ones((2, 2, 3)).tolist(),
+        locpot={0: [1.0], 1: [2.0], 2: [3.0]},
+    )
+    assert doc == CalculationOutput.model_validate(doc.model_dump())
+    assert doc == CalculationOutput.model_validate_json(doc.model_dump_json())
+
+    dir_name = test_dir / "vasp" / "Si_static"
+    poscar = Poscar.from_file(dir_name / "CONTCAR.gz")
+    grid = np.arange(24, dtype=float).reshape(2, 3, 4)
+    locpot = Locpot(poscar, {"total": grid})
+    doc = CalculationOutput.from_vasp_outputs(
+        Vasprun(dir_name / "vasprun.xml.gz"),
+        Outcar(dir_name / "OUTCAR.gz"),
+        poscar,
+        locpot=locpot,
+    )
+    for i in range(3):
+        assert isinstance(doc.locpot[i], list)
+        assert doc.locpot[i] == pytest.approx(locpot.get_average_along_axis(i))
+    dumped = doc.model_dump()
+    assert CalculationOutput.model_validate(dumped).locpot == doc.locpot
+
+
+def test_calculation_auto_bandstructure_without_projections(test_dir):
+    from emmet.core.vasp.calculation import Calculation, VaspObject
+
+    test_object = get_test_object("SiStatic")
+    dir_name = test_dir / "vasp" / test_object.folder
+    files = test_object.task_files["standard"]
+
+    _, objects = Calculation.from_vasp_files(
+        dir_name,
+        "standard",
+        parse_bandstructure="auto",
+        vasprun_kwargs={"parse_projected_eigen": True},
+        **files,
+    )
+    assert objects[VaspObject.BANDSTRUCTURE].projections == {}
+
+
+def test_calculation_use_cache(test_dir, tmp_path, monkeypatch):
+    import os
+    import pickle
+    import shutil
+
+    from monty.json import jsanitize
+
+    from emmet.core.vasp import calculation
+    from emmet.core.vasp.calculation import Calculation
+
+    test_object = get_test_object("SiStatic")
+    dir_name = tmp_path / "Si_static"
+    shutil.copytree(test_dir / "vasp" / test_object.folder, dir_name)
+    files = test_object.task_files["standard"]
+    cache_file = dir_name / ".emmet_calc_cache_standard.pkl"
+
+    num_parses = 0
+    vasprun_cls = calculation.Vasprun
+
+    def counting_vasprun(*args, **kwargs):
+        nonlocal num_parses
+        num_parses += 1
+        return vasprun_cls(*args, **kwargs)
+
+    monkeypatch.setattr(calculation, "Vasprun", counting_vasprun)
+
+    def parse(**kwargs):
+        calc, objects = Calculation.from_vasp_files(
+            dir_name, "standard", use_cache=True, **files, **kwargs
+        )
+        return jsanitize(calc, strict=True, enum_values=True), objects
+
+    doc, _ = parse()
+    assert num_parses == 1
+    assert cache_file.exists()
+
+    # cache hit returns an equal document without parsing
+    cached_doc, _ = parse()
+    assert num_parses == 1
+    assert cached_doc == doc
+
+    # touching a source file forces a re-parse
+    vasprun_file = dir_name / files["vasprun_file"]
+    mtime = vasprun_file.stat().st_mtime_ns + 10**9
+    os.utime(vasprun_file, ns=(mtime, mtime))
+    parse()
+    assert num_parses == 2
+
+    # rewriting a file with the same mtime but a new size forces a re-parse
+    outcar_file = dir_name / files["outcar_file"]
+    outcar_stat = outcar_file.stat()
+    with open(outcar_file, "ab") as f:
+        f.write(b"\0")
+    os.utime(outcar_file, ns=(outcar_stat.st_atime_ns, outcar_stat.st_mtime_ns))
+    parse()
+    assert num_parses == 3
+
+    # different parsing options miss the cache
+    _, objects = parse(parse_dos=True)
+    assert num_parses == 4
+    assert calculation.VaspObject.DOS in objects
+
+    # a corrupt cache is ignored and rewritten
+    cache_file.write_bytes(b"not a pickle")
+    _, objects = parse(parse_dos=True)
+    assert num_parses == 5
+    assert calculation.VaspObject.DOS in objects
+    parse(parse_dos=True)
+    assert num_parses == 5
+
+    # volumetric data is read from its files rather than stored in the cache
+    _, objects = parse(store_volumetric_data=("chgcar",))
+    assert num_parses == 6
+    assert (
+        calculation.VaspObject.CHGCAR
+        not in pickle.loads(cache_file.read_bytes())["vasp_objects"]
+    )
+    _, objects = parse(store_volumetric_data=("chgcar",))
+    assert num_parses == 6
+    assert calculation.VaspObject.CHGCAR in objects
+
+    # the cache can be kept outside of the calculation directory
+    cache_dir = tmp_path / "cache"
+    parse(cache_dir=cache_dir)
+    parse(cache_dir=cache_dir)
+    assert num_parses == 7
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+
+@pytest.mark.parametrize("folder", ["magnetic_run", "defect_run"])
+def test_get_band_props(test_dir, folder):
+    from pymatgen.electronic_structure.core import OrbitalType
+    from pymatgen.io.vasp import Vasprun
+
+    from emmet.core.vasp.calculation import _get_band_props
+
+    vasprun = Vasprun(test_dir / "vasp" / folder / "vasprun.xml.gz")
+    complete_dos = vasprun.complete_dos
+    structure = vasprun.final_structure
+    dos_props = _get_band_props(complete_dos, structure)
+
+    assert set(dos_props) == {el.name for el in structure.composition.elements}
+    for el in structure.composition.elements:
+        for orb_name, props in dos_props[el.name].items():
+            kwargs = dict(band=OrbitalType[orb_name], elements=[el])
+            expected = {
+                "filling": complete_dos.get_band_filling(**kwargs),
+                "center": complete_dos.get_band_center(**kwargs),
+                "bandwidth": complete_dos.get_band_width(**kwargs),
+                "skewness": complete_dos.get_band_skewness(**kwargs),
+                "kurtosis": complete_dos.get_band_kurtosis(**kwargs),
+                "upper_edge": complete_dos.get_upper_band_edge(**kwargs),
+            }
+            assert props == pytest.approx(expected)
@@ -20,6 +20,10 @@ def test_jsanitize():
     assert clean["world"] is None
     assert json.loads(json.dumps(d)) == json.loads(json.dumps(clean))
 
+    d = {"hello": "world", 1: [True, 2, 3.0, float("nan")]}
+    clean = jsanitize(d)
+    assert clean == {"hello": "world", "1": [True, 2, 3.0, 0]}
+
     d = {"hello": GoodMSONClass(1, 2, 3)}
     with pytest.raises(TypeError):
         json.dumps(d)